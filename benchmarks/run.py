@@ -0,0 +1,194 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import resource
+import shutil
+import socket
+import statistics
+import sys
+import tempfile
+import time
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor
+
+from rufus import RufusClient
+from rufus.crawler import RufusCrawler
+from rufus.sinks import CsvSink, JsonlSink
+from .site import SyntheticSite, serve
+from .stubs import StubDriver, StubLLMClient
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+PROMPT = "We're making a chatbot for HR jobs and benefits."
+SCENARIOS = ('crawler', 'client')
+HIGHER_IS_BETTER = {'pages_per_sec'}
+COMPARED = ('pages_per_sec', 'p50_page_ms', 'p95_page_ms', 'peak_rss_mb', 'bytes_written')
+
+
+def timed_crawler_class(latencies):
+    class TimedCrawler(RufusCrawler):
+        async def crawl_page(self, url, session, depth=0, use_js=False):
+            start = time.perf_counter()
+            try:
+                return await super().crawl_page(url, session, depth, use_js)
+            finally:
+                latencies.append(time.perf_counter() - start)
+    return TimedCrawler
+
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method='inclusive')[q - 1]
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_scenario(scenario, base_url, crawl_options):
+    output_dir = tempfile.mkdtemp(prefix='rufus-bench-')
+    latencies = []
+    crawler_class = timed_crawler_class(latencies)
+    options = dict(crawl_options)
+    options.update(
+        sinks=[JsonlSink(os.path.join(output_dir, 'output.jsonl'), compact_to=os.path.join(output_dir, 'output.json')),
+               CsvSink(os.path.join(output_dir, 'output.csv'))],
+        driver_factory=StubDriver,
+        llm_client=StubLLMClient(),
+    )
+    start = time.perf_counter()
+    if scenario == 'crawler':
+        crawler = crawler_class(base_url, PROMPT, **options)
+        asyncio.run(crawler.start_crawl())
+        documents = crawler.documents_saved
+    else:
+        client = RufusClient()
+        client.crawler_class = crawler_class
+        documents = len(client.scrape(base_url, PROMPT, **options))
+    elapsed = time.perf_counter() - start
+    bytes_written = sum(os.path.getsize(os.path.join(output_dir, name)) for name in os.listdir(output_dir))
+    shutil.rmtree(output_dir, ignore_errors=True)
+    return {
+        'pages': len(latencies),
+        'documents': documents,
+        'seconds': round(elapsed, 3),
+        'pages_per_sec': round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        'p50_page_ms': round(percentile(latencies, 50) * 1000, 2),
+        'p95_page_ms': round(percentile(latencies, 95) * 1000, 2),
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+        'bytes_written': bytes_written,
+    }
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_server(url, timeout=15):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=1):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f'synthetic site did not start at {url}')
+
+
+def compare(results, baseline, tolerance):
+    regressions = []
+    for scenario, metrics in results.items():
+        previous = baseline.get('results', {}).get(scenario)
+        if not previous:
+            continue
+        for metric in COMPARED:
+            old, new = previous.get(metric), metrics.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            worse = change < -tolerance if metric in HIGHER_IS_BETTER else change > tolerance
+            if worse:
+                regressions.append(f'{scenario}.{metric}: {old} -> {new} ({change:+.0%})')
+    return regressions
+
+
+def report(results):
+    columns = ('pages', 'documents', 'seconds') + COMPARED
+    print('scenario'.ljust(10) + ''.join(column.rjust(15) for column in columns))
+    for scenario, metrics in results.items():
+        print(scenario.ljust(10) + ''.join(str(metrics[column]).rjust(15) for column in columns))
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description='Offline crawl benchmark against a synthetic local site.')
+    parser.add_argument('--pages', type=int, default=500)
+    parser.add_argument('--fanout', type=int, default=8)
+    parser.add_argument('--duplicate-ratio', type=float, default=0.1)
+    parser.add_argument('--page-size', type=int, default=4000)
+    parser.add_argument('--error-rate', type=float, default=0.0, help='share of requests answered with 429')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to every response')
+    parser.add_argument('--js-ratio', type=float, default=0.05)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--max-depth', type=int, default=4)
+    parser.add_argument('--parse-workers', type=int, default=0)
+    parser.add_argument('--scenarios', nargs='+', choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument('--baseline', default=BASELINE)
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--tolerance', type=float, default=0.25)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    site = SyntheticSite(pages=args.pages, fanout=args.fanout, duplicate_ratio=args.duplicate_ratio,
+                         page_size=args.page_size, error_rate=args.error_rate, latency=args.latency,
+                         js_ratio=args.js_ratio, seed=args.seed)
+    config = {key: value for key, value in vars(args).items() if key not in ('baseline', 'save_baseline', 'tolerance')}
+    crawl_options = {'max_pages': args.pages + 1, 'max_depth': args.max_depth, 'parse_workers': args.parse_workers}
+
+    port = free_port()
+    base_url = f'http://127.0.0.1:{port}/'
+    server = multiprocessing.Process(target=serve, args=(site, port), daemon=True)
+    server.start()
+    results = {}
+    try:
+        wait_for_server(base_url)
+        for scenario in args.scenarios:
+            # A fresh process per scenario keeps peak RSS and caches from leaking between runs
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                results[scenario] = pool.submit(run_scenario, scenario, base_url, crawl_options).result()
+    finally:
+        server.terminate()
+        server.join()
+
+    report(results)
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump({'config': config, 'results': results}, f, indent=4)
+        print(f'Saved baseline to {args.baseline}')
+        return 0
+    if not os.path.exists(args.baseline):
+        print('No baseline found; run with --save-baseline to record one.')
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline.get('config') != config:
+        print('Warning: baseline was recorded with a different configuration.')
+    regressions = compare(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(f'REGRESSION {regression}')
+    if not regressions:
+        print('No regressions against baseline.')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
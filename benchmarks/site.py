@@ -0,0 +1,81 @@
+import asyncio
+import random
+from aiohttp import web
+
+KEYWORDS = ['hr', 'jobs', 'benefits', 'salary', 'employee', 'hiring']
+TOPICS = ['city', 'county', 'service', 'resident', 'permit', 'office', 'program', 'public', 'street',
+          'library', 'park', 'transit', 'housing', 'health', 'safety', 'budget', 'meeting', 'report']
+# A large vocabulary keeps unrelated pages far apart for the near-duplicate index
+FILLER = [f'{topic}{n}' for topic in TOPICS for n in range(200)]
+
+
+class SyntheticSite:
+    def __init__(self, pages=500, fanout=8, duplicate_ratio=0.1, page_size=4000, error_rate=0.0,
+                 latency=0.0, js_ratio=0.05, seed=0):
+        self.pages = pages
+        self.fanout = fanout
+        self.duplicate_ratio = duplicate_ratio
+        self.page_size = page_size
+        self.error_rate = error_rate  # Share of requests answered with 429
+        self.latency = latency
+        self.js_ratio = js_ratio  # Share of pages served as a <noscript> app shell unless rendered
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+    def _page_rng(self, index):
+        return random.Random(self.seed * 1000003 + index)
+
+    def links(self, index):
+        rng = self._page_rng(index)
+        return [rng.randrange(self.pages) for _ in range(self.fanout)]
+
+    def body(self, index):
+        rng = self._page_rng(index)
+        # Near-duplicates reuse another page's text and only change a date line
+        source = index
+        if index and rng.random() < self.duplicate_ratio:
+            source = rng.randrange(index)
+        text_rng = self._page_rng(source + self.pages)
+        sections = []
+        size = 0
+        section = 0
+        while size < self.page_size:
+            words = [text_rng.choice(FILLER) for _ in range(40)]
+            for _ in range(3):
+                words.insert(text_rng.randrange(len(words)), text_rng.choice(KEYWORDS))
+            paragraph = ' '.join(words)
+            items = ''.join(f'<li>{text_rng.choice(KEYWORDS)} {text_rng.choice(FILLER)}</li>' for _ in range(4))
+            sections.append(f'<h2>Section {source}-{section}</h2><p>{paragraph}</p><ul>{items}</ul>')
+            size += len(paragraph) + len(items) + 30
+            section += 1
+        return (f'<h1>Page {source}</h1><p>hr notice updated on day {index}</p>' + ''.join(sections))
+
+    def html(self, index, rendered=True):
+        anchors = ''.join(f'<a href="/page/{target}">{self._page_rng(target).choice(KEYWORDS)} page {target}</a>'
+                          for target in self.links(index))
+        if not rendered and self._page_rng(index + 2 * self.pages).random() < self.js_ratio:
+            return (f'<html><body><noscript>Enable JavaScript</noscript><div id="root"></div>'
+                    f'{anchors}</body></html>')
+        return (f'<html><head><meta name="description" content="hr jobs page {index}"></head>'
+                f'<body>{self.body(index)}{anchors}</body></html>')
+
+    async def handle(self, request):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.error_rate and self.rng.random() < self.error_rate:
+            return web.Response(status=429, headers={'Retry-After': '1'})
+        index = int(request.match_info.get('index', 0))
+        if index >= self.pages:
+            raise web.HTTPNotFound()
+        rendered = request.headers.get('X-Rendered') == '1'
+        return web.Response(text=self.html(index, rendered), content_type='text/html')
+
+    def app(self):
+        app = web.Application()
+        app.router.add_get('/', self.handle)
+        app.router.add_get('/page/{index}', self.handle)
+        return app
+
+
+def serve(site, port):
+    web.run_app(site.app(), host='127.0.0.1', port=port, print=None, handle_signals=False)
@@ -0,0 +1,42 @@
+import asyncio
+import json
+import urllib.request
+
+
+class StubLLMClient:
+    def __init__(self, keywords=None, delay=0.05):
+        self.keywords = keywords or ['hr', 'jobs', 'benefits', 'salary']
+        self.delay = delay
+        self.calls = 0
+
+    async def complete(self, prompt):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return json.dumps({'keywords': self.keywords})
+
+
+class StubElement:
+    pass
+
+
+# Stands in for a Chrome WebDriver by asking the synthetic site for its rendered variant
+class StubDriver:
+    def __init__(self, user_agent=None):
+        self.page_source = ''
+
+    def get(self, url):
+        request = urllib.request.Request(url, headers={'X-Rendered': '1'})
+        with urllib.request.urlopen(request, timeout=30) as response:
+            self.page_source = response.read().decode('utf-8')
+
+    def find_element(self, by, value):
+        return StubElement()
+
+    def find_elements(self, by, value):
+        return []
+
+    def execute_script(self, script, *args):
+        return None
+
+    def quit(self):
+        pass
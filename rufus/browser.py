@@ -0,0 +1,129 @@
+import asyncio
+import functools
+import random
+import time
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.chrome.options import Options
+from webdriver_manager.chrome import ChromeDriverManager
+
+LOAD_MORE_XPATH = "//*[contains(text(), 'Load more') or contains(text(), 'Show more')]"
+
+
+@functools.lru_cache(maxsize=None)
+def chromedriver_path():
+    return ChromeDriverManager().install()
+
+
+def chrome_driver_factory(user_agent):
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument(f"user-agent={user_agent}")
+    return webdriver.Chrome(service=Service(chromedriver_path()), options=chrome_options)
+
+
+class _Slot:
+    def __init__(self):
+        self.driver = None
+        self.pages = 0
+
+
+class BrowserPool:
+    def __init__(self, size=2, max_pages_per_driver=50, driver_factory=None, user_agents=None,
+                 page_timeout=15, load_more_timeout=10):
+        self.size = size
+        self.max_pages_per_driver = max_pages_per_driver
+        self.driver_factory = driver_factory or chrome_driver_factory
+        self.user_agents = user_agents or [None]
+        self.page_timeout = page_timeout
+        self.load_more_timeout = load_more_timeout
+        self.drivers_started = 0
+        self.drivers_recycled = 0
+        self.slots = None
+
+    async def start(self):
+        # Drivers are created lazily, so a crawl that never needs a browser never starts one
+        self.slots = asyncio.Queue(maxsize=self.size)
+        for _ in range(self.size):
+            self.slots.put_nowait(_Slot())
+
+    async def render(self, url):
+        slot = await self.slots.get()
+        try:
+            return await asyncio.to_thread(self._render, slot, url)
+        finally:
+            self.slots.put_nowait(slot)
+
+    async def close(self):
+        if self.slots is None:
+            return
+        slots = [await self.slots.get() for _ in range(self.size)]
+        await asyncio.to_thread(lambda: [self._retire(slot) for slot in slots])
+        self.slots = None
+
+    def render_once(self, url):
+        # Blocking render on a throwaway driver, for callers outside the event loop
+        slot = _Slot()
+        try:
+            return self._render(slot, url)
+        finally:
+            self._retire(slot)
+
+    def _render(self, slot, url):
+        try:
+            if slot.driver is None:
+                slot.pages = 0
+                self.drivers_started += 1
+                # A driver that fails to launch counts as a crash, so the slot is recycled and the page skipped
+                slot.driver = self.driver_factory(random.choice(self.user_agents))
+            html = self._load(slot.driver, url)
+        except Exception:
+            if slot.driver is None:
+                self.drivers_recycled += 1
+            self._retire(slot)
+            return None
+        slot.pages += 1
+        if slot.pages >= self.max_pages_per_driver:
+            self._retire(slot)
+        return html
+
+    def _retire(self, slot):
+        if slot.driver is None:
+            return
+        try:
+            slot.driver.quit()
+        except Exception:
+            pass
+        slot.driver = None
+        self.drivers_recycled += 1
+
+    def _load(self, driver, url):
+        driver.get(url)
+        try:
+            WebDriverWait(driver, self.page_timeout).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+            self._expand_load_more(driver)
+        except Exception:
+            pass
+        return driver.page_source
+
+    def _expand_load_more(self, driver):
+        deadline = time.monotonic() + self.load_more_timeout
+        while True:
+            load_more_buttons = driver.find_elements(By.XPATH, LOAD_MORE_XPATH)
+            if not load_more_buttons:
+                return
+            before = len(driver.page_source)
+            for button in load_more_buttons:
+                driver.execute_script("arguments[0].click();", button)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            try:
+                # Stop as soon as the page grows instead of sleeping a fixed interval
+                WebDriverWait(driver, remaining, poll_frequency=0.2).until(lambda d: len(d.page_source) != before)
+            except TimeoutException:
+                return
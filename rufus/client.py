@@ -2,10 +2,45 @@ import asyncio
 from .crawler import RufusCrawler
 
 class RufusClient:
+    crawler_class = RufusCrawler
+
     def __init__(self, api_key=None):
         self.api_key = api_key
+        self.stats = None  # CrawlStats of the most recent scrape
 
-    def scrape(self, url, user_prompt):
-        crawler = RufusCrawler(url, user_prompt)
+    def scrape(self, url, user_prompt, **options):
+        crawler = self.crawler_class(url, user_prompt, api_key=self.api_key, **options)
+        self.stats = crawler.stats
         asyncio.run(crawler.start_crawl())
         return crawler.extracted_data
+
+    async def iter_scrape(self, url, user_prompt, max_buffered=100, **options):
+        queue = asyncio.Queue(maxsize=max_buffered)
+        crawler = self.crawler_class(url, user_prompt, api_key=self.api_key, keep_in_memory=False,
+                               document_queue=queue, **options)
+        self.stats = crawler.stats
+        task = asyncio.create_task(self._run_crawler(crawler, queue))
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                page_url, content = item
+                yield {'url': page_url, 'content': content}
+            await task
+        finally:
+            if not task.done():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
+    async def _run_crawler(self, crawler, queue):
+        cancelled = False
+        try:
+            await crawler.start_crawl()
+        except asyncio.CancelledError:
+            # The consumer stopped early and nobody reads the buffer any more, so there is no one to signal
+            cancelled = True
+            raise
+        finally:
+            if not cancelled:
+                await queue.put(None)
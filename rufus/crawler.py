@@ -1,29 +1,52 @@
-import requests
-from bs4 import BeautifulSoup
 import json
-import re
-from urllib.parse import urljoin
+from urllib.parse import urlsplit
 import random
 import asyncio
 import aiohttp
-from aiohttp import ClientResponseError, ClientConnectorError, ClientHttpProxyError, ServerTimeoutError, TooManyRedirects
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 import csv
-import time
-import hashlib
-from concurrent.futures import ThreadPoolExecutor
-import os
+from concurrent.futures import ProcessPoolExecutor
+from collections import namedtuple
 import openai
+from .browser import BrowserPool
+from .dedup import SimHashIndex, canonicalize_url, content_hash, content_text, simhash
+from .frontier import CrawlFrontier
+from .llm import KeywordRefiner, OpenAIKeywordClient
+from .matching import KeywordMatcher
+from .metrics import CrawlStats, NullStats, log_progress
+from . import parsing
+from .sinks import SinkWriter, default_sinks
+from .state import CrawlStateStore
+from .throttle import PolitenessController
+
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+# ClientError covers connection, proxy, redirect and payload errors; timeouts surface as asyncio.TimeoutError
+FETCH_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, ValueError)
+
+# A prefix is sent straight to the browser once rendering fixed this many of its pages, and most of those checked
+RENDER_PREFIX_MIN_PAGES = 3
+
+FetchResult = namedtuple('FetchResult', ['body', 'encoding', 'etag', 'last_modified', 'not_modified'])
 
 class RufusCrawler:
-    def __init__(self, base_url, user_prompt, api_key=None):
+    def __init__(self, base_url, user_prompt, api_key=None, sinks=None, keep_in_memory=True,
+                 document_queue=None, flush_batch_size=50, flush_interval=1.0, max_pages=1000,
+                 max_depth=2, workers=10, max_in_flight=10, browser_pool=None, browser_workers=2,
+                 driver_factory=None, fetch_mode='adaptive', min_text_length=200,
+                 parse_workers=0, canonicalize_urls=True, near_duplicate_threshold=3,
+                 state_path=None, llm_client=None, refine_every=5, llm_token_budget=2000,
+                 link_scoring='density', per_host_connections=8, max_retries=3, respect_robots=True,
+                 request_timeout=30, read_timeout=15, dns_cache_ttl=300, stats=True, progress_interval=None):
         self.base_url = base_url
+        if isinstance(stats, (CrawlStats, NullStats)):
+            self.stats = stats
+        else:
+            self.stats = CrawlStats() if stats else NullStats()
+        self.progress_interval = progress_interval  # Seconds between progress log lines, None for no logging
         self.user_prompt = user_prompt.lower()
         self.visited_urls = set()
         self.extracted_data = {}
@@ -37,100 +60,156 @@ class RufusCrawler:
         self.api_key = api_key
         if self.api_key:
             openai.api_key = self.api_key
+        self.sinks = default_sinks() if sinks is None else sinks
+        self.keep_in_memory = keep_in_memory  # Streaming callers read documents from the sinks/queue instead
+        self.document_queue = document_queue
+        self.writer = SinkWriter(self.sinks, batch_size=flush_batch_size, flush_interval=flush_interval,
+                                 stats=self.stats)
+        self.max_pages = max_pages
+        self.max_depth = max_depth
+        self.workers = workers
+        self.max_in_flight = max_in_flight
+        self.frontier = None
+        self.in_flight = None
+        self.browser_pool = browser_pool or BrowserPool(size=browser_workers, driver_factory=driver_factory,
+                                                        user_agents=self.user_agents)
+        self.fetch_mode = fetch_mode  # 'static', 'js' or 'adaptive'
+        self.min_text_length = min_text_length
+        self.render_prefixes = set()  # render_key of prefixes whose pages go straight to the browser
+        self.render_evidence = {}  # render_key -> [static pages checked, pages rendering fixed]
+        self.pages_fetched = 0
+        self.pages_rendered = 0
+        self.pages_escalated = 0
+        self.documents_saved = 0
+        self.parse_workers = parse_workers  # 0 parses on the event loop thread
+        self.parse_pool = None
+        self.canonicalize_urls = canonicalize_urls
+        # Max differing SimHash bits for two pages to count as near-duplicates; None disables the check
+        self.near_duplicates = None if near_duplicate_threshold is None else SimHashIndex(near_duplicate_threshold)
+        self.duplicate_pages = 0
+        self.near_duplicate_pages = 0
+        self.state_path = state_path  # SQLite file for resumable, incremental crawls
+        self.state = None
+        self.pages_not_modified = 0
+        self.link_scoring = link_scoring  # 'density' or 'bm25'
+        self.per_host_connections = per_host_connections
+        self.request_timeout = request_timeout
+        self.read_timeout = read_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.politeness = PolitenessController(max_window=per_host_connections, max_retries=max_retries,
+                                               respect_robots=respect_robots)
+        if llm_client is None and self.api_key:
+            llm_client = OpenAIKeywordClient(self.api_key)
+        self.refiner = None
+        if llm_client is not None:
+            self.refiner = KeywordRefiner(llm_client, self.apply_refined_keywords, is_relevant=self.is_relevant,
+                                          every_n_pages=refine_every, token_budget=llm_token_budget,
+                                          stats=self.stats)
+
+    @property
+    def refined_keywords(self):
+        return self._refined_keywords
+
+    @refined_keywords.setter
+    def refined_keywords(self, keywords):
+        # Every keyword change recompiles the matcher once instead of rescanning text per keyword
+        self._refined_keywords = list(keywords)
+        self.matcher = KeywordMatcher(self._refined_keywords)
 
     def extract_links(self, soup):
-        links = set()
-        for link in soup.find_all('a', href=True):
-            href = link.get('href')
-            full_url = urljoin(self.base_url, href)
-            if re.match(r'^https?://', full_url) and full_url not in self.visited_urls:
-                keyword_density_score = self.calculate_keyword_density(link.get_text(strip=True))
-                links.add((full_url, keyword_density_score))
-        sorted_links = sorted(links, key=lambda x: x[1], reverse=True)
-        return [link[0] for link in sorted_links]
+        return [link for link, _ in self.extract_scored_links(soup)]
+
+    def extract_scored_links(self, soup):
+        return parsing.extract_scored_links(soup, self.base_url, self.matcher, self.visited_urls, self.link_scoring)
 
     def calculate_keyword_density(self, text):
-        keywords = self.refined_keywords
-        word_count = len(text.split())
-        if word_count == 0:
-            return 0
-        keyword_count = sum(text.lower().count(keyword) for keyword in keywords)
-        return keyword_count / word_count
+        return self.matcher.density(text)
 
     def extract_content(self, soup):
-        content = {}
-        headings = soup.find_all(['h1', 'h2', 'h3'])
-        current_heading = None
-
-        for element in soup.find_all(['h1', 'h2', 'h3', 'p', 'ul', 'ol']):
-            if element.name in ['h1', 'h2', 'h3']:
-                current_heading = element.get_text(strip=True)
-                if current_heading:
-                    content[current_heading] = []
-            elif element.name == 'p' and current_heading:
-                paragraph_text = element.get_text(strip=True)
-                if paragraph_text and self.is_relevant(paragraph_text):
-                    content[current_heading].append(paragraph_text)
-            elif element.name in ['ul', 'ol'] and current_heading:
-                list_items = [li.get_text(strip=True) for li in element.find_all('li') if li.get_text(strip=True) and self.is_relevant(li.get_text(strip=True))]
-                if list_items:
-                    content[current_heading].extend(list_items)
-
-        meta_description = soup.find('meta', attrs={'name': 'description'})
-        if meta_description and meta_description.get('content') and self.is_relevant(meta_description.get('content')):
-            content['Meta Description'] = [meta_description['content']]
-        meta_keywords = soup.find('meta', attrs={'name': 'keywords'})
-        if meta_keywords and meta_keywords.get('content') and self.is_relevant(meta_keywords.get('content')):
-            content['Meta Keywords'] = [meta_keywords['content']]
-
-        return content
+        return parsing.extract_content(soup, self.matcher)
 
     def is_relevant(self, text):
-        return any(keyword in text.lower() for keyword in self.refined_keywords)
+        return self.matcher.is_relevant(text)
 
-    async def fetch(self, session, url):
+    async def fetch_html(self, session, url, validators=None):
         headers = {
             'User-Agent': random.choice(self.user_agents),
             'Referer': self.base_url
         }
-        try:
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    return soup
-                elif response.status == 429:
-                    await asyncio.sleep(random.uniform(5, 10))
-                    return await self.fetch(session, url)
+        etag, last_modified = validators or (None, None)
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        throttle = await self.politeness.throttle(session, url)
+        for attempt in range(self.politeness.max_retries + 1):
+            with self.stats.timer('throttle_wait'):
+                await throttle.acquire()
+            throttled = False
+            self.stats.gauge('requests_in_flight', 1)
+            try:
+                with self.stats.timer('fetch'):
+                    response = await session.get(url, headers=headers)
+                async with response:
+                    self.stats.incr('http_responses', status=response.status)
+                    if response.status == 200:
+                        with self.stats.timer('download'):
+                            body = await response.read()
+                        self.stats.incr('bytes_downloaded', len(body))
+                        return FetchResult(body, response.charset, response.headers.get('ETag'),
+                                           response.headers.get('Last-Modified'), False)
+                    elif response.status == 304 and validators:
+                        return FetchResult(None, None, response.headers.get('ETag', etag),
+                                           response.headers.get('Last-Modified', last_modified), True)
+                    elif response.status in (429, 503):
+                        throttled = True
+                        # Pause the whole host, not just this request
+                        throttle.block_for(self.politeness.retry_delay(attempt, response.headers.get('Retry-After')))
+                        continue
+                    return None
+            except FETCH_ERRORS:
+                # Timeouts and dropped connections are overload signals too, so they shrink the window
+                throttled = True
+                self.stats.incr('fetch_errors')
                 return None
-        except (ClientResponseError, ClientConnectorError, ClientHttpProxyError, ServerTimeoutError, TooManyRedirects, ValueError):
+            finally:
+                self.stats.gauge('requests_in_flight', -1)
+                await throttle.release(throttled)
+        return None
+
+    def make_session(self):
+        connector = aiohttp.TCPConnector(limit=self.max_in_flight, limit_per_host=self.per_host_connections,
+                                         ttl_dns_cache=self.dns_cache_ttl, keepalive_timeout=30)
+        timeout = aiohttp.ClientTimeout(total=self.request_timeout, sock_connect=10, sock_read=self.read_timeout)
+        return aiohttp.ClientSession(connector=connector, timeout=timeout, auto_decompress=True,
+                                     headers={'Accept-Encoding': ACCEPT_ENCODING})
+
+    async def fetch(self, session, url):
+        result = await self.fetch_html(session, url)
+        if result is None:
             return None
+        return parsing.make_soup(result.body, result.encoding)
 
     def fetch_js_content(self, url):
-        try:
-            chrome_options = Options()
-            chrome_options.add_argument("--headless")
-            chrome_options.add_argument(f"user-agent={random.choice(self.user_agents)}")
-            driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
-            driver.get(url)
-            try:
-                WebDriverWait(driver, 15).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-                while True:
-                    load_more_buttons = driver.find_elements(By.XPATH, "//*[contains(text(), 'Load more') or contains(text(), 'Show more')]")
-                    if load_more_buttons:
-                        for button in load_more_buttons:
-                            driver.execute_script("arguments[0].click();", button)
-                            time.sleep(2)
-                    else:
-                        break
-            except Exception:
-                pass
-            content = driver.page_source
-            driver.quit()
-            soup = BeautifulSoup(content, 'html.parser')
-            return soup
-        except Exception:
+        # Kept synchronous for callers that run it in a thread; the crawl itself uses fetch_rendered_page
+        html = self.browser_pool.render_once(url)
+        if html is None:
             return None
+        return parsing.make_soup(html)
+
+    async def parse_html(self, html, encoding=None):
+        # Worker processes get the normalized keywords and compile (and cache) their own matcher
+        keywords = self.matcher if self.parse_pool is None else self.matcher.keywords
+        args = (html, self.base_url, keywords, encoding, self.link_scoring, self.near_duplicates is not None)
+        if self.parse_pool is None:
+            page = parsing.parse_page(*args)
+        else:
+            with self.stats.timer('parse_pool'):
+                page = await asyncio.get_running_loop().run_in_executor(self.parse_pool, parsing.parse_page, *args)
+        # Timed inside parse_page so the numbers are the same whether it ran here or in a worker process
+        self.stats.observe('parse', page.parse_seconds)
+        self.stats.observe('extract', page.extract_seconds)
+        return page
 
     async def validate_link(self, session, url):
         try:
@@ -138,55 +217,252 @@ class RufusCrawler:
                 if response.status == 200:
                     return True
                 return False
-        except (ClientResponseError, ClientConnectorError, ClientHttpProxyError, ServerTimeoutError, ValueError):
+        except FETCH_ERRORS:
             return False
 
     def content_hash(self, content):
-        return hashlib.md5(json.dumps(content, sort_keys=True).encode('utf-8')).hexdigest()
+        return content_hash(content)
+
+    def render_key(self, url):
+        parts = urlsplit(url)
+        segments = [segment for segment in parts.path.split('/') if segment]
+        return parts.netloc.lower(), segments[0] if segments else ''
+
+    def needs_js_rendering(self, page):
+        if page.text_length < self.min_text_length:
+            return True
+        if page.has_noscript and page.text_length < self.min_text_length * 5:
+            return True
+        return not page.has_headings
 
-    async def crawl_page(self, url, session, depth=2, use_js=False):
-        if depth == 0 or url in self.visited_urls:
+    async def fetch_static_page(self, session, url):
+        self.pages_fetched += 1
+        validators = self.state.validators(url) if self.state is not None else None
+        result = await self.fetch_html(session, url, validators)
+        if result is None:
+            return None
+        if result.not_modified:
+            cached = self.state.cached_page(url)
+            if cached is None:
+                return None
+            self.pages_not_modified += 1
+            self.stats.incr('pages_not_modified')
+            content, links, fingerprint, near_fingerprint = cached
+            return parsing.ParsedPage(content, links, 0, False, True, result.etag, result.last_modified, True,
+                                      text_hash=fingerprint, text_simhash=near_fingerprint)
+        page = await self.parse_html(result.body, result.encoding)
+        return page._replace(etag=result.etag, last_modified=result.last_modified)
+
+    async def fetch_rendered_page(self, url):
+        self.pages_rendered += 1
+        with self.stats.timer('render'):
+            html = await self.browser_pool.render(url)
+        self.stats.incr('pages_rendered')
+        self.stats.set_gauge('browser_sessions', self.browser_pool.drivers_started - self.browser_pool.drivers_recycled)
+        if html is None:
+            return None
+        return await self.parse_html(html)
+
+    async def fetch_page(self, session, url, use_js=False):
+        if use_js or self.fetch_mode == 'js':
+            return await self.fetch_rendered_page(url)
+        if self.fetch_mode == 'static':
+            return await self.fetch_static_page(session, url)
+        key = self.render_key(url)
+        if key in self.render_prefixes:
+            return await self.fetch_rendered_page(url)
+        # A static page that looks complete says nothing about its neighbours, so every one is checked
+        page = await self.fetch_static_page(session, url)
+        if page is None or page.not_modified:
+            return page
+        evidence = self.render_evidence.setdefault(key, [0, 0])
+        evidence[0] += 1
+        if not self.needs_js_rendering(page):
+            return page
+        self.pages_escalated += 1
+        self.stats.incr('pages_escalated')
+        rendered = await self.fetch_rendered_page(url)
+        if rendered is not None and not self.needs_js_rendering(rendered):
+            evidence[1] += 1
+            checked, fixed = evidence
+            if fixed >= RENDER_PREFIX_MIN_PAGES and fixed * 2 > checked:
+                self.render_prefixes.add(key)
+        return page if rendered is None else rendered
+
+    def url_key(self, url):
+        # The canonical form only decides whether a URL was seen; the URL as found is what gets fetched
+        return canonicalize_url(url) if self.canonicalize_urls else url
+
+    def enqueue(self, url, depth, score=0):
+        key = self.url_key(url)
+        added = self.frontier.add(url, depth, score, key)
+        if added and self.state is not None:
+            self.state.push(url, depth, score)
+        elif not added and key in self.visited_urls:
+            self.stats.incr('dedup_hits', kind='url')
+        return added
+
+    def page_fingerprints(self, page):
+        # Pages parsed by this version carry fingerprints of their full text; older stored pages fall back to content
+        fingerprint = page.text_hash or self.content_hash(page.content)
+        near_fingerprint = None
+        if self.near_duplicates is not None:
+            near_fingerprint = page.text_simhash
+            if near_fingerprint is None:
+                near_fingerprint = simhash(content_text(page.content))
+        return fingerprint, near_fingerprint
+
+    def is_duplicate(self, url, fingerprint, near_fingerprint=None):
+        if fingerprint in self.content_hashes:
+            self.duplicate_pages += 1
+            self.stats.incr('dedup_hits', kind='exact')
+            return True
+        if self.near_duplicates is not None and near_fingerprint is not None:
+            if self.near_duplicates.find(near_fingerprint) is not None:
+                self.near_duplicate_pages += 1
+                self.stats.incr('dedup_hits', kind='near')
+                return True
+            self.near_duplicates.add(near_fingerprint, url)
+        self.content_hashes.add(fingerprint)
+        return False
+
+    async def crawl_page(self, url, session, depth=0, use_js=False):
+        with self.stats.timer('crawl_page'):
+            await self._crawl_page(url, session, depth, use_js)
+        self.stats.incr('pages_crawled')
+
+    async def _crawl_page(self, url, session, depth, use_js):
+        async with self.in_flight:
+            page = await self.fetch_page(session, url, use_js)
+        if page is not None:
+            content = page.content
+            if content:
+                # Duplicate pages are neither stored nor expanded
+                if self.is_duplicate(url, *self.page_fingerprints(page)):
+                    self.record_page(url, page, saved=False)
+                    return
+                await self.save_document(url, content)
+                if self.refiner is not None and not page.not_modified:
+                    self.refiner.submit(url, content)
+            self.record_page(url, page, saved=bool(content))
+            if depth < self.max_depth:
+                for link, score in page.links:
+                    self.enqueue(link, depth + 1, score)
+
+    async def crawl_worker(self, session):
+        while True:
+            url, depth = await self.frontier.get()
+            try:
+                await self.crawl_page(url, session, depth)
+                # Nothing awaits between record_page and pop, so state commits only fall on page boundaries
+                if self.state is not None:
+                    self.state.pop(url)
+            finally:
+                self.frontier.task_done()
+
+    def apply_refined_keywords(self, keywords):
+        self.refined_keywords = keywords
+        if self.state is not None:
+            self.state.save_keywords(keywords)
+
+    def record_page(self, url, page, saved):
+        if self.state is None:
             return
-        self.visited_urls.add(url)
-        if use_js:
-            soup = await asyncio.to_thread(self.fetch_js_content, url)
-        else:
-            soup = await self.fetch(session, url)
-        if soup:
-            content = self.extract_content(soup)
-            content_hash = self.content_hash(content)
-            if content and content_hash not in self.content_hashes:
-                self.content_hashes.add(content_hash)
-                self.extracted_data[url] = content
-                self.save_to_json()
-                self.save_to_csv()
-                if self.api_key:
-                    refined_keywords = self.refine_keywords_with_llm(content)
-                    if refined_keywords:
-                        self.refined_keywords = refined_keywords
-            if depth > 1:
-                links = self.extract_links(soup)
-                tasks = [self.crawl_page(link, session, depth - 1, use_js) for link in links]
-                await asyncio.gather(*tasks)
+        fingerprint, near_fingerprint = self.page_fingerprints(page) if page.content else (None, None)
+        self.state.record_page(url, page.etag, page.last_modified, fingerprint, page.links, page.content, saved,
+                               near_fingerprint)
+
+    async def restore_state(self):
+        self.visited_urls.update(self.url_key(url) for url in self.state.visited())
+        keywords = self.state.keywords()
+        if keywords:
+            self.refined_keywords = keywords
+        # Documents from the interrupted run go back through the sinks, which start from empty files
+        for url, content, fingerprint, near_fingerprint in self.state.saved_documents():
+            if near_fingerprint is None and self.near_duplicates is not None:
+                near_fingerprint = simhash(content_text(content))
+            self.is_duplicate(url, fingerprint or self.content_hash(content), near_fingerprint)
+            await self.save_document(url, content)
+        for url, depth, score in self.state.pending():
+            self.frontier.add(url, depth, score, self.url_key(url))
+        self.frontier.scheduled = len(self.visited_urls)
+
+    async def save_document(self, url, content):
+        self.documents_saved += 1
+        self.stats.incr('documents_saved')
+        if self.keep_in_memory:
+            self.extracted_data[url] = content
+        await self.writer.put(url, content)
+        if self.document_queue is not None:
+            await self.document_queue.put((url, content))
 
     async def start_crawl(self):
-        async with aiohttp.ClientSession() as session:
-            soup = await self.fetch(session, self.base_url)
-            if soup:
-                content = self.extract_content(soup)
-                content_hash = self.content_hash(content)
-                if content and content_hash not in self.content_hashes:
-                    self.content_hashes.add(content_hash)
-                    self.extracted_data[self.base_url] = content
-                    self.save_to_json()
-                    self.save_to_csv()
-                    if self.api_key:
-                        refined_keywords = self.refine_keywords_with_llm(content)
-                        if refined_keywords:
-                            self.refined_keywords = refined_keywords
-                links = self.extract_links(soup)
-                tasks = [self.crawl_page(link, session, 2, True) for link in links]
-                await asyncio.gather(*tasks)
+        await self.writer.start()
+        await self.browser_pool.start()
+        if self.parse_workers:
+            self.parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers)
+        if self.state_path:
+            self.state = CrawlStateStore(self.state_path)
+        if self.refiner is not None:
+            self.refiner.store = self.state
+            await self.refiner.start()
+        try:
+            await self._crawl()
+            if self.state is not None:
+                self.state.finish()
+        finally:
+            if self.refiner is not None:
+                await self.refiner.close()
+                self.refiner.store = None
+            if self.state is not None:
+                self.state.close()
+                self.state = None
+            if self.parse_pool is not None:
+                await asyncio.to_thread(self.parse_pool.shutdown)
+                self.parse_pool = None
+            await self.browser_pool.close()
+            await self.writer.close()
+
+    async def _crawl(self):
+        self.frontier = CrawlFrontier(self.max_pages, self.max_depth, seen=self.visited_urls)
+        self.in_flight = asyncio.Semaphore(self.max_in_flight)
+        if self.state is not None and self.state.begin():
+            await self.restore_state()
+        else:
+            self.enqueue(self.base_url, 0)
+        self.politeness.reset()
+        async with self.make_session() as session:
+            workers = [asyncio.create_task(self.crawl_worker(session)) for _ in range(self.workers)]
+            drained = asyncio.create_task(self.frontier.join())
+            background = []
+            if self.progress_interval and self.stats.enabled:
+                background.append(asyncio.create_task(log_progress(self.stats, self.progress_interval)))
+            try:
+                await asyncio.wait([drained, *workers], return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                for task in [drained, *workers, *background]:
+                    task.cancel()
+                results = await asyncio.gather(drained, *workers, *background, return_exceptions=True)
+                self.stats.set_gauge('frontier_size', len(self.frontier))
+                self.stats.set_gauge('browser_sessions', 0)
+                self.stats.incr('throttled_responses', self.politeness.throttled_responses)
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+
+    def crawl_summary(self):
+        return {
+            'pages_fetched': self.pages_fetched,
+            'pages_rendered': self.pages_rendered,
+            'pages_escalated': self.pages_escalated,
+            'documents_saved': self.documents_saved,
+            'duplicate_pages': self.duplicate_pages,
+            'near_duplicate_pages': self.near_duplicate_pages,
+            'pages_not_modified': self.pages_not_modified,
+            'llm_calls': self.refiner.calls if self.refiner else 0,
+            'llm_cache_hits': self.refiner.cache_hits if self.refiner else 0,
+            'throttled_responses': self.politeness.throttled_responses,
+        }
 
     def refine_keywords_with_llm(self, content):
         prompt = f"Extracted Content: {json.dumps(content)}\nPlease provide relevant keywords for further crawling."
@@ -0,0 +1,94 @@
+import functools
+import hashlib
+import json
+import re
+from collections import Counter
+from urllib.parse import unquote_plus, urlsplit, urlunsplit
+
+TRACKING_PARAMS = {'gclid', 'fbclid', 'msclkid', 'mc_cid', 'mc_eid', '_ga', '_gl', 'utm'}
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+TOKEN_RE = re.compile(r'\w+')
+FINGERPRINT_BITS = 64
+
+
+def canonicalize_url(url):
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').rstrip('.')
+    if ':' in host:
+        host = f'[{host}]'
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    netloc = host if port is None or DEFAULT_PORTS.get(scheme) == port else f'{host}:{port}'
+    if '@' in parts.netloc:
+        netloc = parts.netloc.rsplit('@', 1)[0] + '@' + netloc
+    path = re.sub(r'/{2,}', '/', parts.path) or '/'
+    if len(path) > 1:
+        path = path.rstrip('/') or '/'
+    # Pairs are kept exactly as written; only the names are decoded to recognise tracking parameters
+    query = [pair for pair in parts.query.split('&') if pair and not _is_tracking(pair.split('=', 1)[0])]
+    return urlunsplit((scheme, netloc, path, '&'.join(sorted(query)), ''))
+
+
+def _is_tracking(name):
+    name = unquote_plus(name).lower()
+    return name.startswith('utm_') or name in TRACKING_PARAMS
+
+
+@functools.lru_cache(maxsize=65536)
+def _token_hash(token):
+    return int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+def text_hash(text):
+    return hashlib.md5(text.encode('utf-8')).hexdigest()
+
+
+def content_hash(content):
+    return text_hash(json.dumps(content, sort_keys=True))
+
+
+def content_text(content):
+    return ' '.join(f"{heading} {' '.join(sections)}" for heading, sections in content.items())
+
+
+def simhash(text):
+    weights = [0] * FINGERPRINT_BITS
+    for token, count in Counter(TOKEN_RE.findall(text.lower())).items():
+        value = _token_hash(token)
+        for bit in range(FINGERPRINT_BITS):
+            weights[bit] += count if value >> bit & 1 else -count
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+class SimHashIndex:
+    def __init__(self, threshold=3):
+        # With threshold + 1 bands, two fingerprints within `threshold` bits share at least one band exactly
+        self.threshold = threshold
+        self.bands = min(threshold + 1, FINGERPRINT_BITS)
+        width = FINGERPRINT_BITS // self.bands
+        self.band_ranges = [(i * width, FINGERPRINT_BITS if i == self.bands - 1 else (i + 1) * width)
+                            for i in range(self.bands)]
+        self.buckets = {}
+        self.size = 0
+
+    def _band_keys(self, fingerprint):
+        for i, (start, end) in enumerate(self.band_ranges):
+            yield i, fingerprint >> start & ((1 << (end - start)) - 1)
+
+    def find(self, fingerprint):
+        for band_key in self._band_keys(fingerprint):
+            for candidate, key in self.buckets.get(band_key, ()):
+                if bin(candidate ^ fingerprint).count('1') <= self.threshold:
+                    return key
+        return None
+
+    def add(self, fingerprint, key):
+        for band_key in self._band_keys(fingerprint):
+            self.buckets.setdefault(band_key, []).append((fingerprint, key))
+        self.size += 1
+
+    def __len__(self):
+        return self.size
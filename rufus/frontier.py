@@ -0,0 +1,38 @@
+import asyncio
+import itertools
+
+
+class CrawlFrontier:
+    def __init__(self, max_pages=1000, max_depth=2, seen=None):
+        self.max_pages = max_pages
+        self.max_depth = max_depth
+        self.seen = set() if seen is None else seen  # Dedup happens here, at enqueue time
+        self.scheduled = 0
+        self.queue = asyncio.PriorityQueue()
+        self.counter = itertools.count()
+
+    def add(self, url, depth, score=0, key=None):
+        # key identifies the page for dedup (e.g. its canonical URL); url is what gets fetched
+        key = url if key is None else key
+        if key in self.seen or depth > self.max_depth:
+            return False
+        if self.max_pages is not None and self.scheduled >= self.max_pages:
+            return False
+        self.seen.add(key)
+        self.scheduled += 1
+        # Highest keyword density first, then shallowest, then first discovered
+        self.queue.put_nowait((-score, depth, next(self.counter), url))
+        return True
+
+    async def get(self):
+        _, depth, _, url = await self.queue.get()
+        return url, depth
+
+    def task_done(self):
+        self.queue.task_done()
+
+    async def join(self):
+        await self.queue.join()
+
+    def __len__(self):
+        return self.queue.qsize()
@@ -0,0 +1,145 @@
+import asyncio
+import json
+from collections import OrderedDict
+import openai
+from .dedup import content_hash
+from .metrics import NullStats
+
+CHARS_PER_TOKEN = 4
+PROMPT = ("Extracted Content from {pages} pages:\n{content}\n"
+          "Please provide relevant keywords for further crawling. "
+          "Respond with a JSON object of the form {{\"keywords\": [\"...\"]}}.")
+
+
+class OpenAIKeywordClient:
+    def __init__(self, api_key=None, model="gpt-3.5-turbo"):
+        self.api_key = api_key
+        self.model = model
+
+    async def complete(self, prompt):
+        response = await openai.ChatCompletion.acreate(
+            model=self.model,
+            api_key=self.api_key,
+            messages=[
+                {"role": "system", "content": "You are a helpful assistant."},
+                {"role": "user", "content": prompt}
+            ]
+        )
+        return response['choices'][0]['message']['content']
+
+
+def parse_keywords(text):
+    try:
+        keywords = json.loads(text).get('keywords', [])
+    except (json.JSONDecodeError, AttributeError):
+        return []
+    return [keyword for keyword in keywords if isinstance(keyword, str) and keyword.strip()]
+
+
+class KeywordRefiner:
+    def __init__(self, client, on_keywords, is_relevant=None, every_n_pages=5, token_budget=2000,
+                 drift_threshold=0.5, cache_size=256, max_pending=100, stats=None):
+        self.client = client
+        self.on_keywords = on_keywords
+        self.is_relevant = is_relevant
+        self.every_n_pages = every_n_pages
+        self.token_budget = token_budget
+        self.drift_threshold = drift_threshold  # Share of off-topic pages that triggers an early refinement
+        self.cache = OrderedDict()  # Page content fingerprint -> keywords of the batch it was refined in
+        self.store = None  # Optional CrawlStateStore that keeps refinements across runs
+        self.cache_size = cache_size
+        self.max_pending = max_pending
+        self.stats = stats or NullStats()
+        self.queue = None
+        self.task = None
+        self.calls = 0
+        self.cache_hits = 0
+        self.dropped_pages = 0
+
+    async def start(self):
+        self.queue = asyncio.Queue(maxsize=self.max_pending)
+        self.task = asyncio.create_task(self._run())
+
+    def submit(self, url, content):
+        # Never blocks the crawl: refinement is advisory, so pages are dropped when the service falls behind
+        try:
+            self.queue.put_nowait((url, content))
+        except asyncio.QueueFull:
+            self.dropped_pages += 1
+            self.stats.incr('llm_pages_dropped')
+
+    async def close(self):
+        if self.task is None:
+            return
+        self.task.cancel()
+        await asyncio.gather(self.task, return_exceptions=True)
+        self.task = None
+
+    async def _run(self):
+        batch = []
+        while True:
+            batch.append(await self.queue.get())
+            while not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            if len(batch) >= self.every_n_pages or self._drifted(batch):
+                pages, batch = batch, []
+                await self.refine(pages)
+
+    def _drifted(self, batch):
+        if self.is_relevant is None or len(batch) < 2:
+            return False
+        off_topic = sum(1 for _, content in batch if not any(self.is_relevant(heading) for heading in content))
+        return off_topic / len(batch) >= self.drift_threshold
+
+    def build_prompt(self, pages):
+        budget = self.token_budget * CHARS_PER_TOKEN // len(pages)
+        parts = []
+        for url, content in pages:
+            text = ' | '.join(f"{heading}: {' '.join(sections)}" for heading, sections in content.items())
+            parts.append(f"[{url}] {text[:budget]}")
+        return PROMPT.format(pages=len(pages), content='\n'.join(parts))
+
+    def cached(self, fingerprint):
+        if fingerprint in self.cache:
+            self.cache.move_to_end(fingerprint)
+            return self.cache[fingerprint]
+        keywords = self.store.refinement(fingerprint) if self.store is not None else None
+        if keywords is not None:
+            self._remember(fingerprint, keywords)
+        return keywords
+
+    def _remember(self, fingerprint, keywords):
+        self.cache[fingerprint] = keywords
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+    async def refine(self, pages):
+        # Pages whose extracted content was already refined, in this run or a stored one, are left out of the
+        # prompt; the crawler dedups on full page text, so pages can differ and still extract the same content
+        fresh = {}
+        for url, content in pages:
+            fingerprint = content_hash(content)
+            if fingerprint in fresh:
+                continue
+            if self.cached(fingerprint) is not None:
+                self.cache_hits += 1
+                self.stats.incr('llm_cache_hits')
+            else:
+                fresh[fingerprint] = (url, content)
+        if not fresh:
+            return []
+        self.calls += 1
+        self.stats.incr('llm_calls')
+        try:
+            with self.stats.timer('refine_keywords'):
+                keywords = parse_keywords(await self.client.complete(self.build_prompt(list(fresh.values()))))
+        except Exception:
+            # Failed calls are not cached, so the pages can be refined again later
+            return []
+        for fingerprint in fresh:
+            self._remember(fingerprint, keywords)
+        if self.store is not None:
+            self.store.save_refinement(fresh, keywords)
+        if keywords:
+            self.on_keywords(keywords)
+        return keywords
@@ -0,0 +1,73 @@
+import functools
+import math
+import re
+from collections import Counter
+
+
+def normalize_keywords(keywords):
+    normalized = []
+    for keyword in keywords:
+        keyword = re.sub(r'^\W+|\W+$', '', keyword.lower())
+        if keyword and keyword not in normalized:
+            normalized.append(keyword)
+    return tuple(normalized)
+
+
+class KeywordMatcher:
+    def __init__(self, keywords):
+        self.keywords = normalize_keywords(keywords)
+        self.pattern = None
+        if self.keywords:
+            # Longest first so that "human resources" wins over "human" in the alternation
+            alternation = '|'.join(re.escape(keyword) for keyword in sorted(self.keywords, key=len, reverse=True))
+            self.pattern = re.compile(rf'(?<!\w)(?:{alternation})(?!\w)', re.IGNORECASE)
+
+    def is_relevant(self, text):
+        return self.pattern is not None and self.pattern.search(text) is not None
+
+    def count(self, text):
+        return len(self.pattern.findall(text)) if self.pattern is not None else 0
+
+    def term_counts(self, text):
+        if self.pattern is None:
+            return Counter()
+        return Counter(match.lower() for match in self.pattern.findall(text))
+
+    def density(self, text):
+        word_count = len(text.split())
+        if word_count == 0:
+            return 0
+        return self.count(text) / word_count
+
+
+@functools.lru_cache(maxsize=32)
+def compile_keywords(keywords):
+    return KeywordMatcher(keywords)
+
+
+def as_matcher(keywords):
+    if isinstance(keywords, KeywordMatcher):
+        return keywords
+    return compile_keywords(tuple(keywords))
+
+
+class Bm25Scorer:
+    def __init__(self, matcher, k1=1.5, b=0.75):
+        self.matcher = matcher
+        self.k1 = k1
+        self.b = b
+
+    def score_batch(self, texts):
+        # The batch is the corpus: document frequencies and average length come from the texts scored together
+        counts = [self.matcher.term_counts(text) for text in texts]
+        lengths = [len(text.split()) for text in texts]
+        if not texts:
+            return []
+        average_length = sum(lengths) / len(texts) or 1
+        document_frequency = Counter(term for term_counts in counts for term in term_counts)
+        idf = {term: math.log(1 + (len(texts) - df + 0.5) / (df + 0.5)) for term, df in document_frequency.items()}
+        scores = []
+        for term_counts, length in zip(counts, lengths):
+            norm = self.k1 * (1 - self.b + self.b * length / average_length)
+            scores.append(sum(idf[term] * tf * (self.k1 + 1) / (tf + norm) for term, tf in term_counts.items()))
+        return scores
@@ -0,0 +1,181 @@
+import asyncio
+import logging
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _series(name, labels):
+    return name, tuple(sorted(labels.items()))
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{value}"' for key, value in labels) + '}'
+
+
+class Histogram:
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q):
+        # Upper bound of the bucket holding the q-th observation
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float('inf')
+
+    def snapshot(self):
+        return {
+            'count': self.count,
+            'sum': round(self.sum, 6),
+            'mean': round(self.sum / self.count, 6) if self.count else 0.0,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+        }
+
+
+class CrawlStats:
+    enabled = True
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counters = defaultdict(int)
+        self.gauges = defaultdict(int)
+        self.histograms = {}
+        self.hooks = []
+        self.started_at = time.monotonic()
+
+    def add_hook(self, callback):
+        # callback(stage, seconds) runs after every timed stage, e.g. to feed an external profiler
+        self.hooks.append(callback)
+
+    def incr(self, name, value=1, **labels):
+        self.counters[_series(name, labels)] += value
+
+    def gauge(self, name, delta, **labels):
+        self.gauges[_series(name, labels)] += delta
+
+    def set_gauge(self, name, value, **labels):
+        self.gauges[_series(name, labels)] = value
+
+    def observe(self, stage, seconds):
+        histogram = self.histograms.get(stage)
+        if histogram is None:
+            histogram = self.histograms[stage] = Histogram(self.buckets)
+        histogram.observe(seconds)
+        for hook in self.hooks:
+            hook(stage, seconds)
+
+    @contextmanager
+    def timer(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    def counter(self, name, **labels):
+        return self.counters.get(_series(name, labels), 0)
+
+    def snapshot(self):
+        def flatten(series):
+            return {name + _format_labels(labels): value for (name, labels), value in sorted(series.items())}
+        return {
+            'elapsed_seconds': round(time.monotonic() - self.started_at, 3),
+            'counters': flatten(self.counters),
+            'gauges': flatten(self.gauges),
+            'stages': {stage: histogram.snapshot() for stage, histogram in sorted(self.histograms.items())},
+        }
+
+    def progress_line(self):
+        elapsed = time.monotonic() - self.started_at
+        pages = self.counter('pages_crawled')
+        return (f"{pages} pages in {elapsed:.0f}s ({pages / elapsed if elapsed else 0:.1f}/s), "
+                f"{self.counter('documents_saved')} documents, "
+                f"{self.gauges.get(_series('requests_in_flight', {}), 0)} requests in flight, "
+                f"{self.counter('bytes_downloaded') / 1e6:.1f} MB downloaded")
+
+    def to_prometheus(self, prefix='rufus'):
+        lines = []
+        for kind, series in (('counter', self.counters), ('gauge', self.gauges)):
+            declared = set()
+            for (name, labels), value in sorted(series.items()):
+                metric = f'{prefix}_{name}_total' if kind == 'counter' else f'{prefix}_{name}'
+                if metric not in declared:
+                    lines.append(f'# TYPE {metric} {kind}')
+                    declared.add(metric)
+                lines.append(f'{metric}{_format_labels(labels)} {value}')
+        if self.histograms:
+            metric = f'{prefix}_stage_seconds'
+            lines.append(f'# TYPE {metric} histogram')
+            for stage, histogram in sorted(self.histograms.items()):
+                cumulative = 0
+                for bound, count in zip(histogram.buckets + (float('inf'),), histogram.counts):
+                    cumulative += count
+                    le = '+Inf' if bound == float('inf') else repr(bound)
+                    lines.append(f'{metric}_bucket{{stage="{stage}",le="{le}"}} {cumulative}')
+                lines.append(f'{metric}_sum{{stage="{stage}"}} {histogram.sum}')
+                lines.append(f'{metric}_count{{stage="{stage}"}} {histogram.count}')
+        return '\n'.join(lines) + '\n'
+
+
+class NullStats:
+    # Same interface as CrawlStats with no bookkeeping, for instrumentation that is switched off
+    enabled = False
+    _timer = nullcontext()
+
+    def add_hook(self, callback):
+        pass
+
+    def incr(self, name, value=1, **labels):
+        pass
+
+    def gauge(self, name, delta, **labels):
+        pass
+
+    def set_gauge(self, name, value, **labels):
+        pass
+
+    def observe(self, stage, seconds):
+        pass
+
+    def timer(self, stage):
+        return self._timer
+
+    def counter(self, name, **labels):
+        return 0
+
+    def snapshot(self):
+        return {}
+
+    def progress_line(self):
+        return ''
+
+    def to_prometheus(self, prefix='rufus'):
+        return ''
+
+
+async def log_progress(stats, interval):
+    while True:
+        await asyncio.sleep(interval)
+        logger.info(stats.progress_line())
@@ -0,0 +1,115 @@
+import time
+from collections import namedtuple
+from urllib.parse import urljoin
+from bs4 import BeautifulSoup
+from .dedup import simhash, text_hash
+from .matching import Bm25Scorer, as_matcher
+
+try:
+    import lxml  # noqa: F401
+    PARSER = 'lxml'
+except ImportError:
+    PARSER = 'html.parser'
+
+HEADINGS = ('h1', 'h2', 'h3')
+META_SECTIONS = {'description': 'Meta Description', 'keywords': 'Meta Keywords'}
+
+# Everything the crawler needs from a page, small enough to ship back from a worker process
+# text_hash/text_simhash fingerprint the unfiltered page text, so pages that only share keyword matches stay apart
+ParsedPage = namedtuple('ParsedPage', ['content', 'links', 'text_length', 'has_noscript', 'has_headings',
+                                       'etag', 'last_modified', 'not_modified', 'parse_seconds', 'extract_seconds',
+                                       'text_hash', 'text_simhash'],
+                        defaults=(None, None, False, 0.0, 0.0, None, None))
+
+
+def make_soup(html, encoding=None):
+    if encoding and isinstance(html, bytes):
+        return BeautifulSoup(html, PARSER, from_encoding=encoding)
+    return BeautifulSoup(html, PARSER)
+
+
+def is_relevant(text, keywords):
+    return as_matcher(keywords).is_relevant(text)
+
+
+def calculate_keyword_density(text, keywords):
+    return as_matcher(keywords).density(text)
+
+
+def extract_content(soup, keywords):
+    return _extract(soup, keywords)[0]
+
+
+def _extract(soup, keywords):
+    # Also returns every heading, paragraph and list item, relevant or not, for page fingerprints
+    is_relevant = as_matcher(keywords).is_relevant
+    content = {}
+    meta = {}
+    text = []
+    current_heading = None
+
+    for element in soup.find_all(['h1', 'h2', 'h3', 'p', 'ul', 'ol', 'meta']):
+        if element.name in HEADINGS:
+            current_heading = element.get_text(strip=True)
+            text.append(current_heading)
+            if current_heading:
+                content[current_heading] = []
+        elif element.name == 'p':
+            paragraph_text = element.get_text(strip=True)
+            text.append(paragraph_text)
+            if current_heading and paragraph_text and is_relevant(paragraph_text):
+                content[current_heading].append(paragraph_text)
+        elif element.name in ('ul', 'ol'):
+            for li in element.find_all('li'):
+                item_text = li.get_text(strip=True)
+                text.append(item_text)
+                if current_heading and item_text and is_relevant(item_text):
+                    content[current_heading].append(item_text)
+        elif element.name == 'meta':
+            name = element.get('name')
+            if name in META_SECTIONS and name not in meta:
+                meta[name] = element.get('content')
+
+    for name, section in META_SECTIONS.items():
+        value = meta.get(name)
+        if value and is_relevant(value):
+            content[section] = [value]
+
+    return content, ' '.join(part for part in text if part)
+
+
+def extract_scored_links(soup, base_url, keywords, visited=(), scoring='density'):
+    matcher = as_matcher(keywords)
+    anchors = []
+    for link in soup.find_all('a', href=True):
+        full_url = urljoin(base_url, link.get('href'))
+        if full_url.startswith(('http://', 'https://')) and full_url not in visited:
+            anchors.append((full_url, link.get_text(strip=True)))
+    if scoring == 'bm25':
+        scores = Bm25Scorer(matcher).score_batch([text for _, text in anchors])
+    else:
+        scores = [matcher.density(text) for _, text in anchors]
+    links = {}
+    for (full_url, _), score in zip(anchors, scores):
+        links[full_url] = max(score, links.get(full_url, 0))
+    return sorted(links.items(), key=lambda x: x[1], reverse=True)
+
+
+def parse_page(html, base_url, keywords, encoding=None, scoring='density', near_duplicates=True):
+    start = time.perf_counter()
+    soup = make_soup(html, encoding)
+    parsed = time.perf_counter()
+    body = soup.body or soup
+    content, text = _extract(soup, keywords)
+    links = extract_scored_links(soup, base_url, keywords, scoring=scoring)
+    return ParsedPage(
+        content=content,
+        links=links,
+        text_length=len(body.get_text(" ", strip=True)),
+        has_noscript=soup.find('noscript') is not None,
+        has_headings=soup.find(HEADINGS) is not None,
+        parse_seconds=parsed - start,
+        extract_seconds=time.perf_counter() - parsed,
+        text_hash=text_hash(text),
+        text_simhash=simhash(text) if near_duplicates else None,
+    )
@@ -0,0 +1,161 @@
+import asyncio
+import csv
+import json
+import os
+import tempfile
+from .metrics import NullStats
+
+_CLOSE = object()
+
+
+class JsonlSink:
+    def __init__(self, filename='output.jsonl', compact_to=None):
+        self.filename = filename
+        self.compact_to = compact_to
+        self.file = None
+
+    def write_batch(self, documents):
+        if self.file is None:
+            self.file = open(self.filename, 'w')
+        for url, content in documents:
+            self.file.write(json.dumps({'url': url, 'content': content}) + '\n')
+        self.file.flush()
+
+    def close(self):
+        if self.file is None:
+            return
+        self.file.close()
+        self.file = None
+        if self.compact_to:
+            compact_jsonl(self.filename, self.compact_to)
+
+
+class CsvSink:
+    def __init__(self, filename='output.csv'):
+        self.filename = filename
+        self.file = None
+        self.writer = None
+
+    def write_batch(self, documents):
+        if self.file is None:
+            self.file = open(self.filename, mode='w', newline='')
+            self.writer = csv.writer(self.file)
+            self.writer.writerow(['URL', 'Heading', 'Content'])
+        for url, contents in documents:
+            for heading, sections in contents.items():
+                self.writer.writerow([url, heading, ' '.join(sections)])
+        self.file.flush()
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+            self.writer = None
+
+
+def default_sinks():
+    return [JsonlSink('output.jsonl', compact_to='output.json'), CsvSink('output.csv')]
+
+
+def compact_jsonl(jsonl_filename, json_filename):
+    # Streams the JSONL log into the same layout json.dump(data, indent=4) produces,
+    # then swaps it into place so readers never see a half-written output.json.
+    directory = os.path.dirname(os.path.abspath(json_filename))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    seen = set()
+    try:
+        with os.fdopen(fd, 'w') as out, open(jsonl_filename) as source:
+            out.write('{')
+            for line in source:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if record['url'] in seen:
+                    continue
+                seen.add(record['url'])
+                body = json.dumps(record['content'], indent=4).replace('\n', '\n    ')
+                out.write(',' if len(seen) > 1 else '')
+                out.write(f"\n    {json.dumps(record['url'])}: {body}")
+            out.write('\n}' if seen else '}')
+        os.replace(tmp_path, json_filename)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class SinkWriter:
+    def __init__(self, sinks, batch_size=50, flush_interval=1.0, max_pending=1000, stats=None):
+        self.sinks = sinks
+        self.stats = stats or NullStats()
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.queue = None
+        self.task = None
+
+    async def start(self):
+        self.queue = asyncio.Queue(maxsize=self.max_pending)
+        self.task = asyncio.create_task(self._run())
+
+    async def put(self, url, content):
+        await self._send((url, content))
+
+    async def close(self):
+        if self.task is None:
+            return
+        try:
+            await self._send(_CLOSE)
+            await self.task
+        finally:
+            self.task = None
+            with self.stats.timer('close_sinks'):
+                await asyncio.to_thread(self._close_sinks)
+
+    async def _send(self, item):
+        # A writer task that died (disk full, permissions) never drains the queue again, so its error
+        # is raised here instead of leaving callers blocked on a full queue
+        if self.task.done():
+            self.task.result()
+        try:
+            self.queue.put_nowait(item)
+            return
+        except asyncio.QueueFull:
+            pass
+        put = asyncio.ensure_future(self.queue.put(item))
+        await asyncio.wait([put, self.task], return_when=asyncio.FIRST_COMPLETED)
+        if not put.done():
+            put.cancel()
+            self.task.result()
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        closing = False
+        while not closing:
+            item = await self.queue.get()
+            if item is _CLOSE:
+                break
+            batch = [item]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self.queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                if item is _CLOSE:
+                    closing = True
+                    break
+                batch.append(item)
+            with self.stats.timer('save'):
+                await asyncio.to_thread(self._write_batch, batch)
+            self.stats.incr('sink_batches')
+
+    def _write_batch(self, batch):
+        for sink in self.sinks:
+            sink.write_batch(batch)
+
+    def _close_sinks(self):
+        for sink in self.sinks:
+            sink.close()
@@ -0,0 +1,137 @@
+import json
+import sqlite3
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS frontier (url TEXT PRIMARY KEY, depth INTEGER, score REAL);
+CREATE TABLE IF NOT EXISTS pages (
+    url TEXT PRIMARY KEY,
+    run_id INTEGER,
+    etag TEXT,
+    last_modified TEXT,
+    fingerprint TEXT,
+    simhash TEXT,
+    links TEXT,
+    content TEXT,
+    saved INTEGER DEFAULT 0,
+    fetched_at REAL
+);
+CREATE TABLE IF NOT EXISTS refinements (fingerprint TEXT PRIMARY KEY, keywords TEXT);
+"""
+
+
+class CrawlStateStore:
+    def __init__(self, path='rufus_state.db', commit_every=100):
+        self.path = path
+        self.commit_every = commit_every  # Pages per transaction
+        self.pending_pages = 0
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA)
+        columns = [row[1] for row in self.conn.execute('PRAGMA table_info(pages)')]
+        if 'simhash' not in columns:
+            self.conn.execute('ALTER TABLE pages ADD COLUMN simhash TEXT')
+        self.run_id = int(self._get_meta('run_id') or 0)
+        self.resuming = False
+
+    def _get_meta(self, key):
+        row = self.conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key, value):
+        self.conn.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (key, value))
+
+    def commit(self):
+        self.conn.commit()
+        self.pending_pages = 0
+
+    def begin(self):
+        # An unfinished run with work left in the frontier is resumed, anything else starts a new run
+        has_frontier = self.conn.execute('SELECT 1 FROM frontier LIMIT 1').fetchone() is not None
+        self.resuming = self._get_meta('status') == 'running' and has_frontier
+        if not self.resuming:
+            self.run_id += 1
+            self.conn.execute('DELETE FROM frontier')
+            self._set_meta('run_id', str(self.run_id))
+        self._set_meta('status', 'running')
+        self.commit()
+        return self.resuming
+
+    def finish(self):
+        self.conn.execute('DELETE FROM frontier')
+        self._set_meta('status', 'complete')
+        self.commit()
+
+    def close(self):
+        self.commit()
+        self.conn.close()
+
+    def push(self, url, depth, score):
+        self.conn.execute('INSERT OR REPLACE INTO frontier (url, depth, score) VALUES (?, ?, ?)', (url, depth, score))
+
+    def pop(self, url):
+        # A page's record, its discovered links and its removal from the frontier land in the same
+        # transaction, so a hard kill never leaves a page marked visited without its links queued
+        self.conn.execute('DELETE FROM frontier WHERE url = ?', (url,))
+        self.pending_pages += 1
+        if self.pending_pages >= self.commit_every:
+            self.commit()
+
+    def pending(self):
+        return self.conn.execute('SELECT url, depth, score FROM frontier').fetchall()
+
+    def visited(self):
+        rows = self.conn.execute('SELECT url FROM pages WHERE run_id = ?', (self.run_id,))
+        return [url for url, in rows]
+
+    def saved_documents(self):
+        rows = self.conn.execute('SELECT url, content, fingerprint, simhash FROM pages WHERE run_id = ? AND saved = 1',
+                                 (self.run_id,))
+        for url, content, fingerprint, simhash in rows:
+            yield url, json.loads(content), fingerprint, _parse_simhash(simhash)
+
+    def validators(self, url):
+        row = self.conn.execute('SELECT etag, last_modified FROM pages WHERE url = ? AND links IS NOT NULL',
+                                (url,)).fetchone()
+        if row is None or not any(row):
+            return None
+        return row
+
+    def cached_page(self, url):
+        row = self.conn.execute('SELECT content, links, fingerprint, simhash FROM pages WHERE url = ?',
+                                (url,)).fetchone()
+        if row is None or row[1] is None:
+            return None
+        content, links, fingerprint, simhash = row
+        return (json.loads(content) if content else {}, [tuple(link) for link in json.loads(links)],
+                fingerprint, _parse_simhash(simhash))
+
+    def record_page(self, url, etag, last_modified, fingerprint, links, content, saved, simhash=None):
+        self.conn.execute(
+            'INSERT OR REPLACE INTO pages (url, run_id, etag, last_modified, fingerprint, simhash, links, content, saved, '
+            'fetched_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (url, self.run_id, etag, last_modified, fingerprint, None if simhash is None else format(simhash, 'x'),
+             json.dumps(links), json.dumps(content) if content else None, int(saved), time.time()))
+
+    def refinement(self, fingerprint):
+        row = self.conn.execute('SELECT keywords FROM refinements WHERE fingerprint = ?', (fingerprint,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save_refinement(self, fingerprints, keywords):
+        value = json.dumps(keywords)
+        self.conn.executemany('INSERT OR REPLACE INTO refinements (fingerprint, keywords) VALUES (?, ?)',
+                              [(fingerprint, value) for fingerprint in fingerprints])
+
+    def save_keywords(self, keywords):
+        self._set_meta('refined_keywords', json.dumps(keywords))
+
+    def keywords(self):
+        value = self._get_meta('refined_keywords')
+        return json.loads(value) if value else None
+
+
+def _parse_simhash(value):
+    # 64-bit fingerprints are stored as hex text, since SQLite integers are signed
+    return None if value is None else int(value, 16)
@@ -0,0 +1,129 @@
+import asyncio
+import random
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+import aiohttp
+
+
+def backoff_delay(attempt, base=1.0, cap=60.0):
+    # Capped exponential backoff with full jitter
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+def parse_retry_after(value):
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_crawl_delay(robots_txt, user_agent='*'):
+    # urllib.robotparser only understands whole-second delays, so groups are read here directly
+    delays = {}
+    agents = []
+    in_agent_lines = False
+    for line in robots_txt.splitlines():
+        field, _, value = line.split('#', 1)[0].partition(':')
+        field, value = field.strip().lower(), value.strip()
+        if field == 'user-agent':
+            if not in_agent_lines:
+                agents = []
+            agents.append(value.lower())
+            in_agent_lines = True
+            continue
+        in_agent_lines = False
+        if field == 'crawl-delay':
+            try:
+                delay = float(value)
+            except ValueError:
+                continue
+            for agent in agents:
+                delays.setdefault(agent, delay)
+    return delays.get(user_agent.lower(), delays.get('*'))
+
+
+class HostThrottle:
+    def __init__(self, initial_window=2, max_window=8, min_interval=0.0):
+        self.window = float(initial_window)
+        self.max_window = max_window
+        self.min_interval = min_interval  # robots.txt Crawl-delay
+        self.in_flight = 0
+        self.next_request_at = 0.0
+        self.blocked_until = 0.0
+        self.condition = asyncio.Condition()
+
+    async def acquire(self):
+        async with self.condition:
+            await self.condition.wait_for(lambda: self.in_flight < int(self.window))
+            self.in_flight += 1
+        now = time.monotonic()
+        start = max(now, self.next_request_at, self.blocked_until)
+        self.next_request_at = start + self.min_interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    async def release(self, throttled=False):
+        async with self.condition:
+            self.in_flight -= 1
+            # AIMD: grow by one request per window of successes, halve on throttling
+            if throttled:
+                self.window = max(1.0, self.window / 2)
+            else:
+                self.window = min(float(self.max_window), self.window + 1 / self.window)
+            self.condition.notify_all()
+
+    def block_for(self, seconds):
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+
+class PolitenessController:
+    def __init__(self, user_agent='*', initial_window=2, max_window=8, max_retries=3, backoff_base=1.0,
+                 backoff_cap=60.0, respect_robots=True):
+        self.user_agent = user_agent
+        self.initial_window = initial_window
+        self.max_window = max_window
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.respect_robots = respect_robots
+        self.reset()
+
+    def reset(self):
+        self.hosts = {}
+        self.robots = {}
+        self.throttled_responses = 0
+
+    async def throttle(self, session, url):
+        parts = urlsplit(url)
+        host = parts.netloc.lower()
+        if host not in self.hosts:
+            if host not in self.robots:
+                self.robots[host] = asyncio.ensure_future(self.crawl_delay(session, f'{parts.scheme}://{host}'))
+            delay = await self.robots[host]
+            self.hosts.setdefault(host, HostThrottle(self.initial_window, self.max_window, delay or 0.0))
+        return self.hosts[host]
+
+    async def crawl_delay(self, session, origin):
+        if not self.respect_robots:
+            return None
+        try:
+            async with session.get(f'{origin}/robots.txt') as response:
+                if response.status != 200:
+                    return None
+                text = await response.text()
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            return None
+        return parse_crawl_delay(text, self.user_agent)
+
+    def retry_delay(self, attempt, retry_after=None):
+        self.throttled_responses += 1
+        delay = parse_retry_after(retry_after)
+        if delay is None:
+            return backoff_delay(attempt, self.backoff_base, self.backoff_cap)
+        return min(delay, self.backoff_cap)
@@ -3,7 +3,7 @@ from setuptools import setup, find_packages
 setup(
     name='Rufus',
     version='0.1.0',
-    packages=find_packages(),
+    packages=find_packages(exclude=['benchmarks']),
     install_requires=[
         'requests',
         'beautifulsoup4',
@@ -12,6 +12,9 @@ setup(
         'webdriver_manager',
         'openai==0.28',
     ],
+    extras_require={
+        'fast': ['lxml'],
+    },
     author='Pranav Kompally',
     author_email='pkompally@gmail.com',
     description='Rufus: An intelligent web scraper for RAG systems',